@@ -1,52 +1,157 @@
 #!/usr/bin/env python3
 """Streamlit frontend for generating eating-disorders quiz PowerPoint decks."""
 
-import io
-import json
+import atexit
+import hashlib
+import os
 import random
+import shutil
 import tempfile
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 
+import orjson
+import pandas as pd
 import streamlit as st
-from pptx import Presentation
 
 from generate_quiz_pptx import QUIZ_BANK_PATH, _load_quiz_bank, build_presentation
 
 
+# Banks at least this large are filtered with pandas masks instead of a Python loop.
+VECTOR_FILTER_MIN_QUESTIONS = 2000
+
 st.set_page_config(page_title="Eating Disorders Quiz PPT Builder", layout="wide")
 
 st.title("Eating Disorders Quiz PPT Builder")
 st.caption("Generate customized quiz decks and append them to existing PowerPoints.")
 
 
+@st.cache_data(show_spinner=False)
+def _load_default_bank(path: str, mtime_ns: int) -> dict:
+    """Parse the bundled quiz bank once per file version; callers get a private copy."""
+    return _load_quiz_bank(Path(path))
+
+
+def _mark_bank_changed():
+    """Bump the working bank version so memoized derivations are rebuilt."""
+    st.session_state["bank_version"] = st.session_state.get("bank_version", 0) + 1
+
+
+def _set_working_bank(quiz_bank: dict):
+    """Make ``quiz_bank`` this session's working bank and index its question IDs."""
+    st.session_state["working_quiz_bank"] = quiz_bank
+    st.session_state["question_id_index"] = _all_question_ids(quiz_bank)
+    _mark_bank_changed()
+
+
+def _memoize_on_bank(name: str, build):
+    """Return ``build()``, reusing the result until the working bank changes.
+
+    Results live in session state rather than ``st.cache_data`` because the
+    working bank is per-session and mutated in place.
+    """
+    memo = st.session_state.setdefault("bank_memo", {})
+    version = st.session_state.get("bank_version", 0)
+    cached = memo.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, build())
+        memo[name] = cached
+    return cached[1]
+
+
+def _normalize_bank(quiz_bank: dict) -> dict:
+    """Fill in schema defaults in place so helpers can index fields directly.
+
+    Question IDs are left as-is: questions without one stay out of merges and
+    selections, as before.
+    """
+    for category in quiz_bank.setdefault("categories", []):
+        category.setdefault("name", "Uncategorized")
+        for question in category.setdefault("questions", []):
+            question.setdefault("type", "multiple_choice")
+            question.setdefault("question", "")
+    return quiz_bank
+
+
+def _reset_question_picker():
+    """Discard pending checkbox edits so the picker table re-reads the selection."""
+    st.session_state["picker_nonce"] = st.session_state.get("picker_nonce", 0) + 1
+
+
+@st.cache_resource(show_spinner=False)
+def _work_dir() -> Path:
+    """Scratch directory shared by all sessions for templates and built decks."""
+    work_dir = Path(tempfile.mkdtemp(prefix="quiz_pptx_"))
+    atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+    return work_dir
+
+
+def _template_file(template_bytes: bytes) -> str:
+    """Write an uploaded template to disk once per distinct upload and reuse the path."""
+    template_hash = hashlib.blake2b(template_bytes, digest_size=8).digest()
+    cached = st.session_state.get("_tpl_cache")
+    if cached is not None:
+        cached_hash, cached_path = cached
+        if cached_hash == template_hash and os.path.exists(cached_path):
+            return cached_path
+        try:
+            os.remove(cached_path)
+        except OSError:
+            pass
+
+    with tempfile.NamedTemporaryFile(suffix=".pptx", dir=_work_dir(), delete=False) as fh:
+        fh.write(template_bytes)
+    st.session_state["_tpl_cache"] = (template_hash, fh.name)
+    return fh.name
+
+
 def _flatten_questions(quiz_bank: dict) -> list[dict]:
     flat = []
-    for category in quiz_bank.get("categories", []):
-        category_name = category.get("name", "Uncategorized")
-        for question in category.get("questions", []):
-            flat.append(
-                {
-                    "id": question.get("id", "UNKNOWN"),
-                    "type": question.get("type", "multiple_choice"),
-                    "category": category_name,
-                    "question": question.get("question", ""),
-                }
-            )
+    for category in quiz_bank["categories"]:
+        category_name = category["name"]
+        for question in category["questions"]:
+            question_id = question.get("id", "UNKNOWN")
+            question_text = question["question"]
+            item = {
+                "id": question_id,
+                "type": question["type"],
+                "category": category_name,
+                "question": question_text,
+                # Lowercased once per bank change so search is one substring test.
+                "search_text": f"{question_id}\x00{category_name}\x00{question_text}".lower(),
+            }
+            item["label"] = _question_label(item)
+            flat.append(item)
     return flat
 
 
-def _build_selected_bank(quiz_bank: dict, selected_ids: set[str]) -> dict:
+def _category_id_sets(quiz_bank: dict) -> list[tuple[dict, frozenset]]:
+    return [
+        (category, frozenset(question.get("id") for question in category["questions"]))
+        for category in quiz_bank["categories"]
+    ]
+
+
+def _build_selected_bank(quiz_bank: dict, selected_ids: AbstractSet[str],
+                         category_id_sets: list[tuple[dict, frozenset]] | None = None) -> dict:
+    if category_id_sets is None:
+        category_id_sets = _category_id_sets(quiz_bank)
+
     categories = []
-    for category in quiz_bank.get("categories", []):
+    for category, category_ids in category_id_sets:
+        # Categories with no picked questions are skipped without a scan.
+        hits = category_ids & selected_ids
+        if not hits:
+            continue
         questions = [
             question
-            for question in category.get("questions", [])
-            if question.get("id") in selected_ids
+            for question in category["questions"]
+            if question.get("id") in hits
         ]
         if questions:
             categories.append(
                 {
-                    "name": category.get("name", "Uncategorized"),
+                    "name": category["name"],
                     "questions": questions,
                 }
             )
@@ -57,21 +162,16 @@ def _build_selected_bank(quiz_bank: dict, selected_ids: set[str]) -> dict:
 
 
 def _question_label(question: dict) -> str:
-    preview = question.get("question", "").strip().replace("\n", " ")
+    preview = question["question"].strip().replace("\n", " ")
     if len(preview) > 110:
         preview = f"{preview[:107]}..."
-    return (
-        f"{question.get('id', 'UNKNOWN')} | "
-        f"{question.get('type', 'multiple_choice')} | "
-        f"{question.get('category', 'Uncategorized')} | "
-        f"{preview}"
-    )
+    return f"{question['id']} | {question['type']} | {question['category']} | {preview}"
 
 
 def _all_question_ids(quiz_bank: dict) -> set[str]:
     ids = set()
-    for category in quiz_bank.get("categories", []):
-        for question in category.get("questions", []):
+    for category in quiz_bank["categories"]:
+        for question in category["questions"]:
             qid = question.get("id")
             if qid:
                 ids.add(qid)
@@ -79,10 +179,7 @@ def _all_question_ids(quiz_bank: dict) -> set[str]:
 
 
 def _category_map(quiz_bank: dict) -> dict[str, dict]:
-    return {
-        category.get("name", "Uncategorized"): category
-        for category in quiz_bank.get("categories", [])
-    }
+    return {category["name"]: category for category in quiz_bank["categories"]}
 
 
 def _add_category_if_missing(quiz_bank: dict, category_name: str):
@@ -91,32 +188,59 @@ def _add_category_if_missing(quiz_bank: dict, category_name: str):
         return
     existing = _category_map(quiz_bank)
     if category_name not in existing:
-        quiz_bank.setdefault("categories", []).append({"name": category_name, "questions": []})
+        quiz_bank["categories"].append({"name": category_name, "questions": []})
+        _mark_bank_changed()
+
+
+def _add_question_to_bank(quiz_bank: dict, category_name: str, question: dict,
+                          categories_by_name: dict[str, dict] | None = None):
+    """Append a question to a category, creating the category if needed.
+
+    Bulk callers can pass ``categories_by_name`` (see ``_category_map``) to
+    skip the category scan; it is updated when a category is created.
+    """
+    if categories_by_name is None:
+        category = next(
+            (candidate for candidate in quiz_bank["categories"] if candidate["name"] == category_name),
+            None,
+        )
+    else:
+        category = categories_by_name.get(category_name)
 
+    if category is None:
+        category = {"name": category_name, "questions": []}
+        quiz_bank["categories"].append(category)
+        if categories_by_name is not None:
+            categories_by_name[category_name] = category
 
-def _add_question_to_bank(quiz_bank: dict, category_name: str, question: dict):
-    _add_category_if_missing(quiz_bank, category_name)
-    categories = _category_map(quiz_bank)
-    categories[category_name].setdefault("questions", []).append(question)
+    category["questions"].append(question)
+    if question.get("id"):
+        st.session_state["question_id_index"].add(question["id"])
+    _mark_bank_changed()
 
 
 def _all_questions_with_category(quiz_bank: dict):
-    for category in quiz_bank.get("categories", []):
-        category_name = category.get("name", "Uncategorized")
-        for question in category.get("questions", []):
-            yield category_name, question
+    for category in quiz_bank["categories"]:
+        for question in category["questions"]:
+            yield category["name"], question
 
 
 def _merge_quiz_banks(base_bank: dict, incoming_bank: dict, overwrite_existing: bool) -> tuple[int, int]:
     """Merge incoming questions into base bank by question ID.
 
+    Incoming question dicts are moved into the base bank as-is, so callers
+    should not reuse ``incoming_bank`` afterwards.
+
     Returns tuple: (added_count, updated_count)
     """
     base_index = {}
-    for category_name, question in _all_questions_with_category(base_bank):
-        qid = question.get("id")
-        if qid:
-            base_index[qid] = (category_name, question)
+    for category in base_bank["categories"]:
+        for question in category["questions"]:
+            qid = question.get("id")
+            if qid:
+                base_index[qid] = (category, question)
+    categories_by_name = _category_map(base_bank)
+    superseded = {}
 
     added_count = 0
     updated_count = 0
@@ -130,28 +254,42 @@ def _merge_quiz_banks(base_bank: dict, incoming_bank: dict, overwrite_existing:
             if not overwrite_existing:
                 continue
 
-            current_category_name, _current_question = base_index[incoming_id]
-            _delete_question_from_bank(base_bank, incoming_id)
+            current_category, current_question = base_index[incoming_id]
+            superseded.setdefault(id(current_category), (current_category, set()))[1].add(
+                id(current_question)
+            )
+            target_category_name = incoming_category_name or current_category["name"]
             _add_question_to_bank(
                 base_bank,
-                incoming_category_name or current_category_name,
-                json.loads(json.dumps(incoming_question)),
+                target_category_name,
+                incoming_question,
+                categories_by_name,
             )
+            base_index[incoming_id] = (categories_by_name[target_category_name], incoming_question)
             updated_count += 1
         else:
             _add_question_to_bank(
                 base_bank,
                 incoming_category_name,
-                json.loads(json.dumps(incoming_question)),
+                incoming_question,
+                categories_by_name,
             )
             added_count += 1
 
+    # Drop replaced questions with one pass per touched category, keeping the
+    # remaining questions in bank order.
+    for category, stale_question_ids in superseded.values():
+        category["questions"] = [
+            question for question in category["questions"]
+            if id(question) not in stale_question_ids
+        ]
+
     return added_count, updated_count
 
 
 def _find_question_entry(quiz_bank: dict, question_id: str):
-    for category in quiz_bank.get("categories", []):
-        for idx, question in enumerate(category.get("questions", [])):
+    for category in quiz_bank["categories"]:
+        for idx, question in enumerate(category["questions"]):
             if question.get("id") == question_id:
                 return category, idx, question
     return None, None, None
@@ -161,7 +299,11 @@ def _delete_question_from_bank(quiz_bank: dict, question_id: str) -> bool:
     category, idx, _question = _find_question_entry(quiz_bank, question_id)
     if category is None:
         return False
-    category.get("questions", []).pop(idx)
+    category["questions"].pop(idx)
+    # IDs are not guaranteed unique; keep it indexed while another question uses it.
+    if _find_question_entry(quiz_bank, question_id)[0] is None:
+        st.session_state["question_id_index"].discard(question_id)
+    _mark_bank_changed()
     return True
 
 
@@ -175,31 +317,35 @@ if not use_default_bank:
         help="Upload a JSON file following the same schema as questions/quiz_bank.json.",
     )
 
-quiz_bank = None
-try:
-    if use_default_bank:
-        quiz_bank = _load_quiz_bank(QUIZ_BANK_PATH)
-    elif uploaded_bank is not None:
-        quiz_bank = json.loads(uploaded_bank.getvalue().decode("utf-8"))
-except Exception as exc:
-    st.error("Unable to load quiz bank JSON.")
-    st.exception(exc)
-
-if not quiz_bank:
-    st.info("Load a quiz bank to continue.")
-    st.stop()
-
 source_signature = "default" if use_default_bank else (
     uploaded_bank.name if uploaded_bank is not None else "none"
 )
+# Only read and parse the source when it changes; otherwise the session's
+# working bank is already the current one.
 if (
     "working_quiz_bank" not in st.session_state
     or st.session_state.get("bank_source_signature") != source_signature
 ):
-    st.session_state["working_quiz_bank"] = json.loads(json.dumps(quiz_bank))
+    quiz_bank = None
+    try:
+        if use_default_bank:
+            quiz_bank = _load_default_bank(str(QUIZ_BANK_PATH), QUIZ_BANK_PATH.stat().st_mtime_ns)
+        elif uploaded_bank is not None:
+            quiz_bank = orjson.loads(uploaded_bank.getvalue())
+    except Exception as exc:
+        st.error("Unable to load quiz bank JSON.")
+        st.exception(exc)
+
+    if not quiz_bank:
+        st.info("Load a quiz bank to continue.")
+        st.stop()
+
+    # The bank was parsed fresh on this run, so the session can own it as-is.
+    _set_working_bank(_normalize_bank(quiz_bank))
     st.session_state["bank_source_signature"] = source_signature
 
 quiz_bank = st.session_state["working_quiz_bank"]
+flat_questions = _memoize_on_bank("flat_questions", lambda: _flatten_questions(quiz_bank))
 
 st.subheader("1b) Edit Question Bank (Optional)")
 with st.expander("Add categories/questions from the frontend", expanded=False):
@@ -226,13 +372,14 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
             st.error("Upload a JSON file to import.")
         else:
             try:
-                imported_bank = json.loads(import_bank_file.getvalue().decode("utf-8"))
+                imported_bank = orjson.loads(import_bank_file.getvalue())
                 if not isinstance(imported_bank, dict) or "categories" not in imported_bank:
                     st.error("Invalid quiz bank format: missing top-level 'categories'.")
                 else:
+                    _normalize_bank(imported_bank)
                     if import_mode == "Replace current working bank":
-                        st.session_state["working_quiz_bank"] = imported_bank
-                        st.session_state["selected_question_ids"] = []
+                        _set_working_bank(imported_bank)
+                        st.session_state["selected_question_ids"] = {}
                         st.success("Replaced current working bank with imported bank.")
                     else:
                         added_count, updated_count = _merge_quiz_banks(
@@ -248,7 +395,9 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                 st.error("Unable to import quiz bank JSON.")
                 st.exception(exc)
 
-    existing_categories = [c.get("name", "Uncategorized") for c in quiz_bank.get("categories", [])]
+    category_names = _memoize_on_bank(
+        "category_names", lambda: [c["name"] for c in quiz_bank["categories"]]
+    )
 
     new_category_col_1, new_category_col_2 = st.columns([3, 1])
     with new_category_col_1:
@@ -261,7 +410,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
         if st.button("Add category"):
             if not new_category_name:
                 st.error("Enter a category name first.")
-            elif new_category_name in existing_categories:
+            elif new_category_name in category_names:
                 st.warning("That category already exists.")
             else:
                 _add_category_if_missing(quiz_bank, new_category_name)
@@ -276,10 +425,9 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
             key="add_q_type",
         )
 
-        category_options = [c.get("name", "Uncategorized") for c in quiz_bank.get("categories", [])]
         selected_category = st.selectbox(
             "Category",
-            category_options,
+            category_names,
             key="add_q_category",
         )
 
@@ -290,7 +438,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
             question_text = st.text_area("Question stem", height=110).strip()
 
             clinical_stem = ""
-            choices = {}
+            choice_values = ()
             answer = ""
 
             if q_type in {"multiple_choice", "case_vignette"}:
@@ -301,7 +449,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                 with choice_col_2:
                     choice_c = st.text_input("Choice C").strip()
                     choice_d = st.text_input("Choice D").strip()
-                choices = {"A": choice_a, "B": choice_b, "C": choice_c, "D": choice_d}
+                choice_values = (choice_a, choice_b, choice_c, choice_d)
                 answer = st.selectbox("Correct answer", ["A", "B", "C", "D"]).strip()
 
                 if q_type == "case_vignette":
@@ -315,17 +463,15 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
             add_question_clicked = st.form_submit_button("Add question to bank")
 
             if add_question_clicked:
-                existing_ids = _all_question_ids(quiz_bank)
-
                 if not q_id:
                     st.error("Question ID is required.")
-                elif q_id in existing_ids:
+                elif q_id in st.session_state["question_id_index"]:
                     st.error("Question ID already exists. Use a unique ID.")
                 elif not question_text:
                     st.error("Question stem is required.")
                 elif not explanation:
                     st.error("Explanation is required.")
-                elif q_type in {"multiple_choice", "case_vignette"} and any(not v for v in choices.values()):
+                elif q_type in {"multiple_choice", "case_vignette"} and not all(choice_values):
                     st.error("All choices A-D are required for this question type.")
                 elif q_type == "case_vignette" and not clinical_stem:
                     st.error("Clinical stem is required for case vignette questions.")
@@ -341,7 +487,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                     }
 
                     if q_type in {"multiple_choice", "case_vignette"}:
-                        new_question["choices"] = choices
+                        new_question["choices"] = dict(zip("ABCD", choice_values))
                     if q_type == "case_vignette":
                         new_question["clinical_stem"] = clinical_stem
 
@@ -351,15 +497,13 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
 
     with st.expander("Edit or delete a question", expanded=False):
         st.markdown("### Edit or delete an existing question")
-        editable_flat = _flatten_questions(quiz_bank)
-
-        if not editable_flat:
+        if not flat_questions:
             st.info("No existing questions to edit yet.")
         else:
-            edit_option_map = {
-                _question_label(item): item["id"]
-                for item in editable_flat
-            }
+            edit_option_map = _memoize_on_bank(
+                "edit_option_map",
+                lambda: {item["label"]: item["id"] for item in flat_questions},
+            )
             current_question = None
             edit_choice = st.selectbox(
                 "Select question to edit",
@@ -371,12 +515,12 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                 current_category, _current_idx, current_question = _find_question_entry(quiz_bank, edit_qid)
 
             if current_question is not None:
-                current_type = current_question.get("type", "multiple_choice")
+                current_type = current_question["type"]
                 current_choices = current_question.get("choices", {})
-                category_options = [c.get("name", "Uncategorized") for c in quiz_bank.get("categories", [])]
-                current_category_name = current_category.get("name", "Uncategorized")
+                current_category_name = current_category["name"]
+                category_options = category_names
                 if current_category_name not in category_options:
-                    category_options.append(current_category_name)
+                    category_options = [*category_names, current_category_name]
 
                 with st.form("edit_question_form"):
                     edit_q_id = st.text_input("Question ID", value=current_question.get("id", "")).strip()
@@ -405,13 +549,13 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                     )
                     edit_question_text = st.text_area(
                         "Question stem",
-                        value=current_question.get("question", ""),
+                        value=current_question["question"],
                         height=110,
                     ).strip()
 
                     edit_clinical_stem = ""
                     edit_answer = ""
-                    edit_choices = {}
+                    edit_choice_values = ()
 
                     if edit_q_type in {"multiple_choice", "case_vignette"}:
                         edit_choice_col_1, edit_choice_col_2 = st.columns(2)
@@ -422,12 +566,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                             edit_choice_c = st.text_input("Choice C", value=current_choices.get("C", "")).strip()
                             edit_choice_d = st.text_input("Choice D", value=current_choices.get("D", "")).strip()
 
-                        edit_choices = {
-                            "A": edit_choice_a,
-                            "B": edit_choice_b,
-                            "C": edit_choice_c,
-                            "D": edit_choice_d,
-                        }
+                        edit_choice_values = (edit_choice_a, edit_choice_b, edit_choice_c, edit_choice_d)
                         edit_answer = st.selectbox(
                             "Correct answer",
                             ["A", "B", "C", "D"],
@@ -460,19 +599,15 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                     save_edit_clicked = st.form_submit_button("Save changes")
 
                     if save_edit_clicked:
-                        existing_ids = _all_question_ids(quiz_bank)
-
                         if not edit_q_id:
                             st.error("Question ID is required.")
-                        elif edit_q_id != edit_qid and edit_q_id in existing_ids:
+                        elif edit_q_id != edit_qid and edit_q_id in st.session_state["question_id_index"]:
                             st.error("Question ID already exists. Use a unique ID.")
                         elif not edit_question_text:
                             st.error("Question stem is required.")
                         elif not edit_explanation:
                             st.error("Explanation is required.")
-                        elif edit_q_type in {"multiple_choice", "case_vignette"} and any(
-                            not value for value in edit_choices.values()
-                        ):
+                        elif edit_q_type in {"multiple_choice", "case_vignette"} and not all(edit_choice_values):
                             st.error("All choices A-D are required for this question type.")
                         elif edit_q_type == "case_vignette" and not edit_clinical_stem:
                             st.error("Clinical stem is required for case vignette questions.")
@@ -488,7 +623,7 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                             }
 
                             if edit_q_type in {"multiple_choice", "case_vignette"}:
-                                updated_question["choices"] = edit_choices
+                                updated_question["choices"] = dict(zip("ABCD", edit_choice_values))
                             if edit_q_type == "case_vignette":
                                 updated_question["clinical_stem"] = edit_clinical_stem
 
@@ -496,12 +631,12 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                             _delete_question_from_bank(quiz_bank, edit_qid)
                             _add_question_to_bank(quiz_bank, edit_category, updated_question)
 
-                            if "selected_question_ids" in st.session_state:
-                                selected_set = set(st.session_state["selected_question_ids"])
-                                if edit_qid in selected_set:
-                                    selected_set.remove(edit_qid)
-                                    selected_set.add(edit_q_id)
-                                    st.session_state["selected_question_ids"] = sorted(selected_set)
+                            selected_ids = st.session_state.get("selected_question_ids", {})
+                            if edit_qid in selected_ids:
+                                st.session_state["selected_question_ids"] = {
+                                    (edit_q_id if qid == edit_qid else qid): None
+                                    for qid in selected_ids
+                                }
 
                             st.success(
                                 f"Updated question {edit_qid} → {edit_q_id} "
@@ -520,179 +655,219 @@ with st.expander("Add categories/questions from the frontend", expanded=False):
                         deleted = _delete_question_from_bank(quiz_bank, edit_qid)
                         if deleted:
                             if "selected_question_ids" in st.session_state:
-                                st.session_state["selected_question_ids"] = [
-                                    qid for qid in st.session_state["selected_question_ids"]
-                                    if qid != edit_qid
-                                ]
+                                st.session_state["selected_question_ids"].pop(edit_qid, None)
                             st.success(f"Deleted question {edit_qid}.")
                             st.rerun()
                         else:
                             st.warning("Question not found; it may have already been removed.")
 
-    bank_json = json.dumps(quiz_bank, indent=2, ensure_ascii=False)
+    bank_json_bytes = _memoize_on_bank(
+        "bank_json_bytes",
+        lambda: orjson.dumps(quiz_bank, option=orjson.OPT_INDENT_2),
+    )
     st.download_button(
         label="Download updated quiz bank JSON",
-        data=bank_json.encode("utf-8"),
+        data=bank_json_bytes,
         file_name="quiz_bank_updated.json",
         mime="application/json",
     )
 
-flat_questions = _flatten_questions(quiz_bank)
 if not flat_questions:
     st.error("No questions found in the loaded quiz bank.")
     st.stop()
 
 st.subheader("2) Select Questions")
 
+# Insertion-ordered dict used as an ordered set: O(1) membership, bank order kept.
 if "selected_question_ids" not in st.session_state:
-    st.session_state["selected_question_ids"] = []
+    st.session_state["selected_question_ids"] = {}
 
-all_types = sorted({item["type"] for item in flat_questions})
-category_order = list(dict.fromkeys(item["category"] for item in flat_questions))
 
-filter_col_1, filter_col_2 = st.columns(2)
-with filter_col_1:
-    selected_types = st.multiselect(
-        "Question types",
-        all_types,
-        default=all_types,
-    )
-with filter_col_2:
-    selected_categories = st.multiselect(
-        "Categories",
-        category_order,
-        default=category_order,
+@st.fragment
+def _question_selection_panel(quiz_bank: dict, flat_questions: list[dict]):
+    """Filters and pickers for step 2.
+
+    Runs as a fragment so typing in the search box or ticking questions only
+    reruns this panel; the chosen IDs are handed to step 3 via session state.
+    """
+    previous_selection = frozenset(st.session_state["selected_question_ids"])
+    all_types, category_order = _memoize_on_bank(
+        "filter_options",
+        lambda: (
+            sorted({item["type"] for item in flat_questions}),
+            list(dict.fromkeys(c["name"] for c in quiz_bank["categories"] if c["questions"])),
+        ),
     )
 
-search_query = st.text_input(
-    "Search question text / ID",
-    placeholder="Type keywords like electrolyte, DSM-5, BN...",
-).strip().lower()
-
-eligible_questions = [
-    item for item in flat_questions
-    if item["type"] in selected_types and item["category"] in selected_categories
-]
-
-if search_query:
-    eligible_questions = [
-        item for item in eligible_questions
-        if (
-            search_query in item.get("question", "").lower()
-            or search_query in item.get("id", "").lower()
-            or search_query in item.get("category", "").lower()
+    filter_col_1, filter_col_2 = st.columns(2)
+    with filter_col_1:
+        selected_types = st.multiselect(
+            "Question types",
+            all_types,
+            default=all_types,
+        )
+    with filter_col_2:
+        selected_categories = st.multiselect(
+            "Categories",
+            category_order,
+            default=category_order,
         )
-    ]
 
-summary_col_1, summary_col_2 = st.columns(2)
-with summary_col_1:
-    st.caption(f"Eligible questions: {len(eligible_questions)}")
-with summary_col_2:
-    st.caption(f"Currently selected: {len(st.session_state['selected_question_ids'])}")
+    search_query = st.text_input(
+        "Search question text / ID",
+        placeholder="Type keywords like electrolyte, DSM-5, BN...",
+    ).strip().lower()
 
-if not eligible_questions:
-    st.warning("No questions match the selected type/category filters.")
-    st.stop()
+    # Display columns only: the picker tables send the whole frame to the browser.
+    question_frame = _memoize_on_bank(
+        "question_frame",
+        lambda: pd.DataFrame(flat_questions, columns=["id", "type", "category", "question"]),
+    )
+    selected_type_set = frozenset(selected_types)
+    selected_category_set = frozenset(selected_categories)
+    # An empty query is a substring of every search_text, so one pass covers all filters.
+    if len(flat_questions) >= VECTOR_FILTER_MIN_QUESTIONS:
+        search_text = _memoize_on_bank(
+            "question_search_text",
+            lambda: pd.Series([item["search_text"] for item in flat_questions]),
+        )
+        eligible_mask = (
+            question_frame["type"].isin(selected_type_set)
+            & question_frame["category"].isin(selected_category_set)
+            & search_text.str.contains(search_query, regex=False)
+        )
+        eligible_positions = eligible_mask.to_numpy().nonzero()[0].tolist()
+    else:
+        eligible_positions = [
+            position for position, item in enumerate(flat_questions)
+            if item["type"] in selected_type_set
+            and item["category"] in selected_category_set
+            and search_query in item["search_text"]
+        ]
+    eligible_questions = [flat_questions[i] for i in eligible_positions]
 
-selection_mode = st.radio(
-    "Question selection mode",
-    ["Pick specific questions", "Random sample", "First N in bank order"],
-    horizontal=False,
-)
+    summary_col_1, summary_col_2 = st.columns(2)
+    with summary_col_1:
+        st.caption(f"Eligible questions: {len(eligible_questions)}")
+    with summary_col_2:
+        st.caption(f"Currently selected: {len(st.session_state['selected_question_ids'])}")
 
-selected_question_ids = list(st.session_state["selected_question_ids"])
-if selection_mode in {"Random sample", "First N in bank order"}:
-    default_count = min(20, len(eligible_questions))
-    question_count = st.slider(
-        "How many questions to include",
-        min_value=1,
-        max_value=len(eligible_questions),
-        value=default_count,
+    if not eligible_questions:
+        st.warning("No questions match the selected type/category filters.")
+        st.stop()
+
+    eligible_ids = [item["id"] for item in eligible_questions]
+
+    selection_mode = st.radio(
+        "Question selection mode",
+        ["Pick specific questions", "Random sample", "First N in bank order"],
+        horizontal=False,
     )
-    if selection_mode == "Random sample":
-        selected_question_ids = [item["id"] for item in random.sample(eligible_questions, question_count)]
-    else:
-        selected_question_ids = [item["id"] for item in eligible_questions[:question_count]]
-else:
-    st.markdown("Use quick actions or manually pick exact questions below.")
-
-    action_col_1, action_col_2, action_col_3 = st.columns([1, 1, 2])
-    with action_col_1:
-        if st.button("Select all filtered"):
-            st.session_state["selected_question_ids"] = [item["id"] for item in eligible_questions]
-    with action_col_2:
-        if st.button("Clear selection"):
-            st.session_state["selected_question_ids"] = []
-    with action_col_3:
-        random_pick_n = st.number_input(
-            "Random add (N)",
+
+    selected_question_ids = list(st.session_state["selected_question_ids"])
+    if selection_mode in {"Random sample", "First N in bank order"}:
+        default_count = min(20, len(eligible_questions))
+        question_count = st.slider(
+            "How many questions to include",
             min_value=1,
             max_value=len(eligible_questions),
-            value=min(10, len(eligible_questions)),
-            step=1,
-        )
-        if st.button("Apply random add"):
-            st.session_state["selected_question_ids"] = [
-                item["id"] for item in random.sample(eligible_questions, int(random_pick_n))
-            ]
-
-    filtered_by_id = {item["id"]: item for item in eligible_questions}
-    retained_defaults = {
-        qid for qid in st.session_state["selected_question_ids"]
-        if qid in filtered_by_id
-    }
-
-    picker_view = st.radio(
-        "Picker view",
-        ["Grouped by category", "Single combined list"],
-        horizontal=True,
-    )
-
-    if picker_view == "Single combined list":
-        selected_question_ids = st.multiselect(
-            "Pick exact questions",
-            options=[item["id"] for item in eligible_questions],
-            default=sorted(retained_defaults),
-            format_func=lambda qid: _question_label(filtered_by_id[qid]),
+            value=default_count,
         )
+        if selection_mode == "Random sample":
+            selected_question_ids = random.sample(eligible_ids, question_count)
+        else:
+            selected_question_ids = eligible_ids[:question_count]
     else:
-        selected_question_ids = []
-        filtered_categories = list(dict.fromkeys(item["category"] for item in eligible_questions))
-        category_counts = {
-            category: sum(1 for item in eligible_questions if item["category"] == category)
-            for category in filtered_categories
+        st.markdown("Use quick actions or manually pick exact questions below.")
+
+        action_col_1, action_col_2, action_col_3 = st.columns([1, 1, 2])
+        with action_col_1:
+            if st.button("Select all filtered"):
+                st.session_state["selected_question_ids"] = dict.fromkeys(eligible_ids)
+                _reset_question_picker()
+        with action_col_2:
+            if st.button("Clear selection"):
+                st.session_state["selected_question_ids"] = {}
+                _reset_question_picker()
+        with action_col_3:
+            random_pick_n = st.number_input(
+                "Random add (N)",
+                min_value=1,
+                max_value=len(eligible_questions),
+                value=min(10, len(eligible_questions)),
+                step=1,
+            )
+            if st.button("Apply random add"):
+                st.session_state["selected_question_ids"] = dict.fromkeys(
+                    random.sample(eligible_ids, int(random_pick_n))
+                )
+                _reset_question_picker()
+
+        filtered_by_id = {item["id"]: item for item in eligible_questions}
+        # Same rows as eligible_questions, by position: ids need not be unique.
+        eligible_frame = question_frame.iloc[eligible_positions]
+        table_columns = ("selected", "id", "type", "category", "question")
+        retained_defaults = {
+            qid for qid in st.session_state["selected_question_ids"]
+            if qid in filtered_by_id
         }
 
-        for category in filtered_categories:
-            category_items = [item for item in eligible_questions if item["category"] == category]
-            category_ids = [item["id"] for item in category_items]
-            category_default = [qid for qid in category_ids if qid in retained_defaults]
-
-            with st.expander(f"{category} ({category_counts[category]})", expanded=False):
-                category_selected = st.multiselect(
-                    f"Questions in {category}",
-                    options=category_ids,
-                    default=category_default,
-                    key=f"cat_picker_{category}",
-                    format_func=lambda qid: _question_label(filtered_by_id[qid]),
-                )
-                selected_question_ids.extend(category_selected)
-
-    table_rows = []
-    selected_id_set = set(selected_question_ids)
-    for item in eligible_questions:
-        table_rows.append(
-            {
-                "selected": "✓" if item["id"] in selected_id_set else "",
-                "id": item["id"],
-                "type": item["type"],
-                "category": item["category"],
-                "question": item["question"],
-            }
+        picker_view = st.radio(
+            "Picker view",
+            ["Grouped by category", "Single combined list"],
+            horizontal=True,
         )
-    st.dataframe(table_rows, width="stretch", hide_index=True, height=340)
 
-st.session_state["selected_question_ids"] = selected_question_ids
+        if picker_view == "Single combined list":
+            selected_question_ids = st.multiselect(
+                "Pick exact questions",
+                options=eligible_ids,
+                default=sorted(retained_defaults),
+                format_func=lambda qid: filtered_by_id[qid]["label"],
+            )
+        else:
+            # One checkbox table instead of a multiselect per category. Rows keep
+            # bank order, so questions stay grouped by category. The key changes
+            # with the eligible rows and on quick actions, because pending edits
+            # are stored by row position.
+            edited_frame = st.data_editor(
+                eligible_frame.assign(selected=eligible_frame["id"].isin(retained_defaults)),
+                key=f"question_picker_{st.session_state.get('picker_nonce', 0)}_{hash(tuple(eligible_ids))}",
+                column_order=table_columns,
+                column_config={"selected": st.column_config.CheckboxColumn("Pick")},
+                disabled=["id", "type", "category", "question"],
+                hide_index=True,
+                width="stretch",
+                height=340,
+            )
+            selected_question_ids = edited_frame.loc[edited_frame["selected"], "id"].tolist()
+
+    if selection_mode == "Pick specific questions" and picker_view == "Single combined list":
+        selected_marks = eligible_frame["id"].isin(selected_question_ids).map({True: "✓", False: ""})
+        st.dataframe(
+            eligible_frame.assign(selected=selected_marks),
+            column_order=table_columns,
+            width="stretch",
+            hide_index=True,
+            height=340,
+        )
+
+    st.session_state["selected_question_ids"] = dict.fromkeys(selected_question_ids)
+
+    # A fragment rerun leaves step 3's output on screen; a generated deck that no
+    # longer matches the selection is cleared with a full rerun.
+    if (
+        st.session_state.get("deck_on_screen")
+        and frozenset(selected_question_ids) != previous_selection
+    ):
+        st.session_state["deck_on_screen"] = False
+        st.session_state.pop("built_deck", None)
+        st.rerun(scope="app")
+
+
+# Full runs redraw step 3 from scratch, so nothing generated is on screen yet.
+st.session_state["deck_on_screen"] = False
+_question_selection_panel(quiz_bank, flat_questions)
 
 st.subheader("3) Output Options")
 fmt = st.selectbox(
@@ -721,6 +896,7 @@ output_name = st.text_input(
 ).strip()
 
 generate_clicked = st.button("Generate PowerPoint", type="primary")
+selected_question_ids = st.session_state["selected_question_ids"]
 
 if generate_clicked:
     try:
@@ -734,28 +910,44 @@ if generate_clicked:
         if not output_name.lower().endswith(".pptx"):
             output_name = f"{output_name}.pptx"
 
-        custom_bank = _build_selected_bank(quiz_bank, set(selected_question_ids))
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            template_path = None
-            if uploaded_template is not None:
-                template_path = tmpdir_path / "template_input.pptx"
-                template_path.write_bytes(uploaded_template.getvalue())
-
-            output_path = tmpdir_path / output_name
-            built_path = build_presentation(
-                quiz_bank=custom_bank,
-                category_filter=None,
-                fmt=fmt,
-                output_path=str(output_path),
-                template_path=str(template_path) if template_path else None,
-                insert_position=insert_position,
+        template_path = None
+        if uploaded_template is not None:
+            template_path = _template_file(uploaded_template.getvalue())
+
+        # Generating the same deck again (e.g. under another filename) reuses the
+        # last build. The template path changes whenever the upload does.
+        build_key = (
+            st.session_state["bank_version"],
+            frozenset(selected_question_ids),
+            fmt,
+            template_path,
+            insert_position,
+        )
+        built_deck = st.session_state.get("built_deck")
+        if built_deck is not None and built_deck[0] == build_key:
+            _, pptx_bytes, slides_count = built_deck
+        else:
+            custom_bank = _build_selected_bank(
+                quiz_bank,
+                selected_question_ids.keys(),
+                _memoize_on_bank("category_id_sets", lambda: _category_id_sets(quiz_bank)),
             )
 
-            pptx_bytes = Path(built_path).read_bytes()
-            slides_count = len(Presentation(io.BytesIO(pptx_bytes)).slides)
+            fd, output_path = tempfile.mkstemp(suffix=".pptx", dir=_work_dir())
+            os.close(fd)
+            try:
+                built_path, slides_count = build_presentation(
+                    quiz_bank=custom_bank,
+                    category_filter=None,
+                    fmt=fmt,
+                    output_path=output_path,
+                    template_path=template_path,
+                    insert_position=insert_position,
+                )
+                pptx_bytes = Path(built_path).read_bytes()
+            finally:
+                os.remove(output_path)
+            st.session_state["built_deck"] = (build_key, pptx_bytes, slides_count)
 
         st.success(
             f"Presentation generated successfully ({slides_count} slides, "
@@ -767,5 +959,6 @@ if generate_clicked:
             file_name=output_name,
             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
         )
+        st.session_state["deck_on_screen"] = True
     except Exception as exc:
         st.exception(exc)
@@ -11,20 +11,35 @@ Usage:
     python generate_quiz_pptx.py --output my_quiz.pptx
     python generate_quiz_pptx.py --format lightning_round
     python generate_quiz_pptx.py --format audience_response
+    python generate_quiz_pptx.py --jobs 4  # render question slides in 4 processes (default: 1)
 
 Requirements:
     pip install python-pptx
+    pip install orjson  # optional, faster quiz bank loading
 """
 
 import argparse
-import json
+import functools
+import re
 import sys
+import zipfile
+from itertools import repeat
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches
+
+try:
+    import orjson
+except ImportError:  # the stdlib parser is slower but reads the same bytes
+    import json
+
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Theme colours (deep navy + gold accent, professional medical feel)
@@ -38,14 +53,94 @@ RED = RGBColor(0xB3, 0x1B, 0x1B)        # distractor / wrong
 
 QUIZ_BANK_PATH = Path(__file__).parent / "questions" / "quiz_bank.json"
 
+# ---------------------------------------------------------------------------
+# Layout lengths, converted to EMU once at import
+# ---------------------------------------------------------------------------
+I0_02 = Inches(0.02)
+I0_05 = Inches(0.05)
+I0_06 = Inches(0.06)
+I0_08 = Inches(0.08)
+I0_1 = Inches(0.1)
+I0_12 = Inches(0.12)
+I0_15 = Inches(0.15)
+I0_2 = Inches(0.2)
+I0_24 = Inches(0.24)
+I0_25 = Inches(0.25)
+I0_3 = Inches(0.3)
+I0_35 = Inches(0.35)
+I0_4 = Inches(0.4)
+I0_45 = Inches(0.45)
+I0_5 = Inches(0.5)
+I0_55 = Inches(0.55)
+I0_6 = Inches(0.6)
+I0_65 = Inches(0.65)
+I0_7 = Inches(0.7)
+I0_72 = Inches(0.72)
+I0_75 = Inches(0.75)
+I0_8 = Inches(0.8)
+I0_85 = Inches(0.85)
+I0_9 = Inches(0.9)
+I0_95 = Inches(0.95)
+I1_0 = Inches(1.0)
+I1_05 = Inches(1.05)
+I1_1 = Inches(1.1)
+I1_15 = Inches(1.15)
+I1_2 = Inches(1.2)
+I1_25 = Inches(1.25)
+I1_4 = Inches(1.4)
+I1_5 = Inches(1.5)
+I1_55 = Inches(1.55)
+I1_6 = Inches(1.6)
+I1_65 = Inches(1.65)
+I1_75 = Inches(1.75)
+I1_8 = Inches(1.8)
+I1_85 = Inches(1.85)
+I1_9 = Inches(1.9)
+I2_0 = Inches(2.0)
+I2_05 = Inches(2.05)
+I2_1 = Inches(2.1)
+I2_2 = Inches(2.2)
+I2_6 = Inches(2.6)
+I2_85 = Inches(2.85)
+I2_9 = Inches(2.9)
+I3_5 = Inches(3.5)
+I3_6 = Inches(3.6)
+I3_75 = Inches(3.75)
+I3_8 = Inches(3.8)
+I4_6 = Inches(4.6)
+I5_45 = Inches(5.45)
+I5_5 = Inches(5.5)
+I5_9 = Inches(5.9)
+I7_5 = Inches(7.5)
+I13_33 = Inches(13.33)
+
+# Multiple-choice answer pills: top-left corner of each row, lettered fill and
+# the grey used for distractors on the reveal slide.
+_MC_POSITIONS = ((I0_4, I2_9), (I0_4, I3_75), (I0_4, I4_6), (I0_4, I5_45))
+_MC_LETTERS = frozenset("ABCD")
+_MC_CHOICE_FILL = RGBColor(0x1A, 0x4A, 0x7A)
+_MC_DIMMED_FILL = RGBColor(0xCC, 0xCC, 0xCC)
+# Reveal-slide (fill, icon, bold) for a pill, keyed on "is this the answer".
+_MC_REVEAL_STYLES = {
+    True: (GREEN, "✓", True),
+    False: (_MC_DIMMED_FILL, " ", False),
+}
+
+# Jeopardy point rows, score-tracker score fill and key-fact row tops.
+_JEOPARDY_POINT_LABELS = ("$100", "$200", "$300", "$400", "$500")
+_SCORE_AREA_FILL = RGBColor(0x1A, 0x3A, 0x6A)
+_FACT_TOPS = tuple(I1_2 + i * I0_72 for i in range(7))
+
 
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
 
 def _load_quiz_bank(path: Path) -> dict:
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _get_filtered_categories(quiz_bank: dict, category_filter: str = None) -> list:
@@ -54,9 +149,10 @@ def _get_filtered_categories(quiz_bank: dict, category_filter: str = None) -> li
     if not category_filter:
         return categories
 
+    needle = category_filter.lower()
     filtered = [
         category for category in categories
-        if category_filter.lower() in category.get("name", "").lower()
+        if needle in category.get("name", "").lower()
     ]
     return filtered
 
@@ -77,51 +173,428 @@ def _place_new_slides(prs: Presentation, original_slide_count: int, insert_posit
         slide_id_list.insert(idx, slide_id)
 
 
-def _set_slide_background(slide, colour: RGBColor):
-    """Fill the slide background with a solid colour."""
-    fill = slide.background.fill
-    fill.solid()
-    fill.fore_color.rgb = colour
+@functools.lru_cache(maxsize=None)
+def _fast_package_writer():
+    """
+    Return a PackageWriter subclass that deflates at level 1 instead of zlib's
+    default 6, or None if python-pptx's (private) writer classes have moved.
+
+    Written against the pptx.opc.serialized internals of python-pptx 1.0.x
+    (checked on 1.0.2): _ZipPkgWriter._zipf, PackageWriter._write and its
+    _write_* steps, and OpcPackage._rels. _save_presentation() falls back to
+    prs.save() if a later release changes them.
+    """
+    try:
+        from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+        from pptx.util import lazyproperty
+    except ImportError:
+        return None
+
+    class _FastZipPkgWriter(_ZipPkgWriter):
+        @lazyproperty
+        def _zipf(self) -> zipfile.ZipFile:
+            return zipfile.ZipFile(self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED,
+                                   compresslevel=1, strict_timestamps=False)
+
+    class _FastPackageWriter(PackageWriter):
+        def _write(self) -> None:
+            with _FastZipPkgWriter(self._pkg_file) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+
+    return _FastPackageWriter
+
+
+def _save_presentation(prs: Presentation, path: str):
+    """
+    Same as `prs.save(path)`, but with fast level-1 deflate.
+
+    Slide XML compresses almost as well at level 1 and saves noticeably
+    quicker on large decks. The fast path relies on python-pptx internals;
+    if they are missing, this falls back to a plain `prs.save(path)`.
+    """
+    writer = _fast_package_writer()
+    if writer is not None:
+        package = prs.part.package
+        try:
+            writer.write(path, package._rels, tuple(package.iter_parts()))
+            return
+        except AttributeError:
+            pass
+    prs.save(path)
+
+
+# What slide.background.fill.solid() plus a fore_color assignment produce. Parsed
+# inside a declaring <p:cSld> so the <p:bg> itself carries no xmlns attributes.
+_BACKGROUND_XML = (
+    "<p:cSld %s><p:bg><p:bgPr><a:solidFill><a:srgbClr val=\"{}\"/></a:solidFill>"
+    "<a:effectLst/></p:bgPr></p:bg></p:cSld>" % nsdecls("a", "p")
+)
+
+
+def _set_slide_background(slide, colour):
+    """Fill the slide background with a solid colour (an RGBColor or hex string)."""
+    cSld = slide._element.cSld
+    if cSld.bg is not None:
+        cSld.remove(cSld.bg)
+    cSld.insert(0, parse_xml(_BACKGROUND_XML.format(colour))[0])
+
+
+# Shapes are built straight from XML rather than through python-pptx's shape
+# and text-frame setters, which rewrite the element tree once per property.
+# The markup matches what add_textbox()/add_shape() plus those setters produce.
+# Fragments carry no namespace declarations; _append_shapes() parses them inside
+# a declaring <p:spTree> wrapper.
+_TEXT_BOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr algn="{align}"/><a:r><a:rPr sz="{size}" b="{bold}">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr><a:t>{text}</a:t></a:r></a:p>'
+    "</p:txBody></p:sp>"
+)
+
+_RECT_SP_PR_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rectangle {name_id}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill><a:ln>{line}</a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+)
+
+_RECT_XML = (
+    _RECT_SP_PR_XML
+    + '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    "</p:sp>"
+)
+
+# A filled rectangle carrying its own label. Insets place the text where a
+# separate text box over the rectangle used to sit.
+_FILLED_TEXT_XML = (
+    _RECT_SP_PR_XML
+    + '<p:txBody><a:bodyPr wrap="square" lIns="{l_ins}" tIns="{t_ins}" rIns="{r_ins}" rtlCol="0" anchor="t"/>'
+    '<a:lstStyle/><a:p><a:pPr algn="{align}"/><a:r><a:rPr sz="{size}" b="{bold}">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr><a:t>{text}</a:t></a:r></a:p>'
+    "</p:txBody></p:sp>"
+)
+
+# A native table: one <p:graphicFrame> instead of a shape per cell. Every cell
+# gets its own fill and four borders, so no table style is referenced.
+_TABLE_XML = (
+    '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{id}" name="Table {name_id}"/>'
+    '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>'
+    '<p:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></p:xfrm>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+    "<a:tbl><a:tblPr/><a:tblGrid>{grid}</a:tblGrid>{rows}</a:tbl>"
+    "</a:graphicData></a:graphic></p:graphicFrame>"
+)
+
+_TABLE_CELL_XML = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p><a:pPr algn="ctr"/><a:r><a:rPr sz="{size}" b="1">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr><a:t>{text}</a:t></a:r></a:p></a:txBody>'
+    '<a:tcPr marL="{margin}" marR="{margin}" marT="{margin}" marB="{margin}" anchor="ctr">{borders}'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr></a:tc>'
+)
+
+_SHAPE_TREE_OPEN = "<p:spTree %s>" % nsdecls("a", "p")
+
+# Control characters other than tab and line feed are not valid XML; python-pptx
+# writes them as "_xHHHH_" escapes, and so do we.
+_CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def _xml_text(text) -> str:
+    text = _CTRL_CHARS_RE.sub(lambda match: "_x%04X_" % ord(match.group()), str(text))
+    return escape(text)
+
+
+def _template_text(text) -> str:
+    """Escape literal text for use inside a shape template (braces survive format_map)."""
+    return _xml_text(text).replace("{", "{{").replace("}", "}}")
+
+
+def _text_box_xml(text: str, left, top, width, height,
+                  font_size: int = 18, bold: bool = False,
+                  color: RGBColor = WHITE, align=PP_ALIGN.LEFT,
+                  wrap: bool = True, shape_id="{id}", name_id="{name_id}") -> str:
+    """Return <p:sp> markup for a text box; `text` must already be XML-escaped.
+
+    Left at the default ids, the result is a template for _append_shape_template.
+    """
+    return _TEXT_BOX_XML.format(
+        id=shape_id, name_id=name_id,
+        left=int(left), top=int(top), width=int(width), height=int(height),
+        wrap="square" if wrap else "none", align=align.xml_value,
+        size=font_size * 100, bold=int(bool(bold)), color=color, text=text,
+    )
+
+
+def _rect_xml(left, top, width, height, fill_color: RGBColor,
+              line_color: RGBColor = None, shape_id="{id}", name_id="{name_id}") -> str:
+    """Return <p:sp> markup for a solid rectangle, borderless unless `line_color` is set."""
+    if line_color:
+        line = f'<a:solidFill><a:srgbClr val="{line_color}"/></a:solidFill>'
+    else:
+        line = "<a:noFill/>"
+    return _RECT_XML.format(
+        id=shape_id, name_id=name_id,
+        left=int(left), top=int(top), width=int(width), height=int(height),
+        fill=fill_color, line=line,
+    )
+
+
+def _filled_text_xml(text: str, left, top, width, height, fill_color,
+                     text_inset: tuple, text_width, font_size: int = 18,
+                     bold: bool = False, color: RGBColor = WHITE,
+                     align=PP_ALIGN.LEFT, shape_id="{id}", name_id="{name_id}") -> str:
+    """Return <p:sp> markup for a borderless filled rectangle with its label inside.
+
+    The label is laid out as if it were a `text_width`-wide text box offset by
+    `text_inset` (dx, dy) from the rectangle's top-left corner. Text boxes have
+    python-pptx's default insets: 0.1" left/right, 0.05" top/bottom.
+    """
+    dx, dy = text_inset
+    return _FILLED_TEXT_XML.format(
+        id=shape_id, name_id=name_id,
+        left=int(left), top=int(top), width=int(width), height=int(height),
+        fill=fill_color, line="<a:noFill/>",
+        l_ins=int(dx + I0_1), t_ins=int(dy + I0_05),
+        r_ins=int(width - dx - text_width + I0_1),
+        align=align.xml_value, size=font_size * 100, bold=int(bool(bold)),
+        color=color, text=text,
+    )
+
+
+def _table_xml(rows: list, left, top, col_width, row_height, fill_color: RGBColor,
+               border_color: RGBColor, border_width, color: RGBColor,
+               shape_id="{id}", name_id="{name_id}") -> str:
+    """Return <p:graphicFrame> markup for a table of equally sized, bold, centred cells.
+
+    `rows` holds one list of (escaped text, font size) pairs per table row.
+    """
+    col_width, row_height = int(col_width), int(row_height)
+    n_cols = len(rows[0])
+    border_fill = f'<a:solidFill><a:srgbClr val="{border_color}"/></a:solidFill>'
+    borders = "".join(f'<a:{side} w="{int(border_width)}">{border_fill}</a:{side}>'
+                      for side in ("lnL", "lnR", "lnT", "lnB"))
+    row_xml = []
+    for row in rows:
+        cells = "".join(
+            _TABLE_CELL_XML.format(text=text, size=font_size * 100, color=color,
+                                   margin=int(I0_05), borders=borders, fill=fill_color)
+            for text, font_size in row
+        )
+        row_xml.append(f'<a:tr h="{row_height}">{cells}</a:tr>')
+    return _TABLE_XML.format(
+        id=shape_id, name_id=name_id,
+        left=int(left), top=int(top), width=col_width * n_cols, height=row_height * len(rows),
+        grid=f'<a:gridCol w="{col_width}"/>' * n_cols, rows="".join(row_xml),
+    )
+
+
+def _append_shapes(slide, shapes_xml: str) -> list:
+    """Parse consecutive <p:sp> fragments and append them to the slide in order."""
+    shapes = list(parse_xml(_SHAPE_TREE_OPEN + shapes_xml + "</p:spTree>"))
+    slide.shapes._spTree.extend(shapes)
+    return shapes
+
+
+def _fill_shape_template(fragments: tuple, values: dict, first_id: int) -> str:
+    """Fill per-shape templates from `values`, numbering shapes from `first_id`."""
+    parts = []
+    for offset, fragment in enumerate(fragments):
+        values["id"] = first_id + offset
+        values["name_id"] = first_id + offset - 1
+        parts.append(fragment.format_map(values))
+    return "".join(parts)
+
+
+def _flush_shapes(slide, fragments: list) -> list:
+    """Number shape templates from the slide's next free id and append them in one batch."""
+    return _append_shapes(slide, _fill_shape_template(fragments, {}, slide.shapes._next_shape_id))
+
+
+def _blank_layout(prs: Presentation, slide_layout=None):
+    """Return `slide_layout`, or look up the blank layout when none is passed in."""
+    return prs.slide_layouts[6] if slide_layout is None else slide_layout
+
+
+def _first_free_shape_id(slide_layout) -> int:
+    """Id python-pptx gives the first shape added to a new slide from `slide_layout`.
+
+    A new slide's shape tree starts at id 1 and add_slide() numbers each cloned
+    layout placeholder after it.
+    """
+    return 2 + sum(1 for _ in slide_layout.iter_cloneable_placeholders())
+
+
+def _add_rendered_slides(prs: Presentation, slide_layout, rendered: list) -> tuple:
+    """Add one slide per (background hex, shapes XML) pair from render_question_xml()."""
+    slides = []
+    for background, shapes_xml in rendered:
+        slide = prs.slides.add_slide(slide_layout)
+        _set_slide_background(slide, background)
+        _append_shapes(slide, shapes_xml)
+        slides.append(slide)
+    return tuple(slides)
 
 
 def _add_text_box(slide, text: str, left, top, width, height,
                   font_size: int = 18, bold: bool = False,
                   color: RGBColor = WHITE, align=PP_ALIGN.LEFT,
                   wrap: bool = True) -> object:
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = wrap
-    p = tf.paragraphs[0]
-    p.alignment = align
-    run = p.add_run()
-    run.text = text
-    run.font.size = Pt(font_size)
-    run.font.bold = bold
-    run.font.color.rgb = color
-    return txBox
+    shape_id = slide.shapes._next_shape_id
+    xml = _text_box_xml(_xml_text(text), left, top, width, height,
+                        font_size, bold, color, align, wrap,
+                        shape_id=shape_id, name_id=shape_id - 1)
+    return _append_shapes(slide, xml)[0]
 
 
 def _add_rect(slide, left, top, width, height,
               fill_color: RGBColor, line_color: RGBColor = None):
-    shape = slide.shapes.add_shape(
-        1,  # MSO_SHAPE_TYPE.RECTANGLE
-        left, top, width, height
+    shape_id = slide.shapes._next_shape_id
+    xml = _rect_xml(left, top, width, height, fill_color, line_color,
+                    shape_id=shape_id, name_id=shape_id - 1)
+    return _append_shapes(slide, xml)[0]
+
+
+def _pill_xml(text: str, left, top, width, height, fill_color, text_inset: tuple,
+              text_width, bold: bool = False) -> str:
+    """Return the template for one answer pill with its 17pt white label inside."""
+    return _filled_text_xml(text, left, top, width, height, fill_color, text_inset, text_width,
+                            font_size=17, bold=bold, color=WHITE, align=PP_ALIGN.LEFT)
+
+
+@functools.lru_cache(maxsize=None)
+def _mc_question_template(width: int, height: int, n_choices: int) -> tuple:
+    """Shape templates for a multiple-choice question slide of the given size."""
+    content_w = width - I0_8
+    choice_text_w = width - I1_1
+    fragments = [
+        _rect_xml(0, 0, width, I1_05, NAVY),
+        _text_box_xml("Q{q_num}  |  {topic}",
+                      I0_3, I0_1, width - I0_6, I0_45,
+                      font_size=14, bold=False, color=GOLD, align=PP_ALIGN.LEFT),
+        _text_box_xml("Difficulty: {difficulty}",
+                      width - I2_0, I0_1, I1_8, I0_45,
+                      font_size=13, bold=False, color=LIGHT_GREY, align=PP_ALIGN.RIGHT),
+        _text_box_xml("{stem}",
+                      I0_4, I1_15, content_w, I1_6,
+                      font_size=20, bold=True, color=NAVY, align=PP_ALIGN.LEFT),
+    ]
+    for idx, (lx, ly) in enumerate(_MC_POSITIONS[:n_choices]):
+        # coloured pill
+        fragments.append(_pill_xml(f"{{letter{idx}}}.  {{text{idx}}}",
+                                   lx, ly, content_w, I0_75, f"{{fill{idx}}}",
+                                   (I0_15, I0_08), choice_text_w))
+    fragments.append(_text_box_xml(_xml_text("⏱  Discuss with your team, then advance to reveal the answer."),
+                                   I0_4, height - I0_55, content_w, I0_45,
+                                   font_size=13, bold=False, color=NAVY, align=PP_ALIGN.CENTER))
+    return tuple(fragments)
+
+
+@functools.lru_cache(maxsize=None)
+def _mc_reveal_template(width: int, height: int, n_choices: int, correct_idx) -> tuple:
+    """Shape templates for a multiple-choice answer reveal with `correct_idx` highlighted."""
+    content_w = width - I0_8
+    choice_text_w = width - I1_1
+    fragments = [
+        _rect_xml(0, 0, width, I1_05, GREEN),
+        _text_box_xml("Q{q_num}  ANSWER REVEAL  |  {topic}",
+                      I0_3, I0_1, width - I0_6, I0_45,
+                      font_size=14, bold=True, color=WHITE, align=PP_ALIGN.LEFT),
+        _text_box_xml("{stem}",
+                      I0_4, I1_15, content_w, I1_1,
+                      font_size=16, bold=False, color=NAVY, align=PP_ALIGN.LEFT),
+    ]
+    # Highlight correct, grey out others
+    for idx, (lx, ly) in enumerate(_MC_POSITIONS[:n_choices]):
+        fill, icon, bold = _MC_REVEAL_STYLES[idx == correct_idx]
+        fragments.append(_pill_xml(f"{icon} {{letter{idx}}}.  {{text{idx}}}",
+                                   lx, ly, content_w, I0_72, fill,
+                                   (I0_12, I0_06), choice_text_w, bold=bold))
+    fragments.append(_rect_xml(I0_35, height - I1_85, width - I0_7, I1_65, NAVY))
+    fragments.append(_text_box_xml("📚  {explanation}",
+                                   I0_5, height - I1_8, width - I1_0, I1_55,
+                                   font_size=14, bold=False, color=WHITE, align=PP_ALIGN.LEFT))
+    return tuple(fragments)
+
+
+@functools.lru_cache(maxsize=None)
+def _true_false_question_template(width: int, height: int) -> tuple:
+    """Shape templates for a true/false question slide of the given size."""
+    return (
+        _rect_xml(0, 0, width, I1_05, NAVY),
+        _text_box_xml("Q{q_num}  |  True or False?  |  {topic}",
+                      I0_3, I0_1, width - I0_6, I0_45,
+                      font_size=14, bold=False, color=GOLD),
+        _text_box_xml("{stem}",
+                      I0_4, I1_2, width - I0_8, I2_0,
+                      font_size=22, bold=True, color=NAVY, align=PP_ALIGN.LEFT),
+        # TRUE / FALSE buttons
+        _filled_text_xml("TRUE", I0_8, I3_5, I3_6, I1_1, GREEN, (0, I0_1), I3_6,
+                         font_size=32, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+        _filled_text_xml("FALSE", I5_5, I3_5, I3_6, I1_1, RED, (0, I0_1), I3_6,
+                         font_size=32, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+        _text_box_xml(_xml_text("⏱  Vote now, then advance to the answer."),
+                      I0_4, height - I0_55, width - I0_8, I0_45,
+                      font_size=13, color=NAVY, align=PP_ALIGN.CENTER),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _true_false_reveal_template(width: int, height: int, answer_is_true: bool) -> tuple:
+    """Shape templates for a true/false answer reveal."""
+    header_color = GREEN if answer_is_true else RED
+    answer_text = "✓  TRUE" if answer_is_true else "✗  FALSE"
+    return (
+        _rect_xml(0, 0, width, I1_05, header_color),
+        _text_box_xml("Q{q_num}  ANSWER REVEAL  |  {topic}",
+                      I0_3, I0_1, width - I0_6, I0_45,
+                      font_size=14, bold=True, color=WHITE),
+        _text_box_xml("{stem}",
+                      I0_4, I1_2, width - I0_8, I1_5,
+                      font_size=18, bold=False, color=NAVY),
+        _text_box_xml(_xml_text(answer_text),
+                      I0_4, I2_85, width - I0_8, I0_75,
+                      font_size=36, bold=True, color=header_color, align=PP_ALIGN.CENTER),
+        _rect_xml(I0_35, height - I2_1, width - I0_7, I1_9, NAVY),
+        _text_box_xml("📚  {explanation}",
+                      I0_5, height - I2_05, width - I1_0, I1_8,
+                      font_size=14, color=WHITE),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _vignette_stem_template(width: int, height: int) -> tuple:
+    """Shape templates for a case vignette's clinical stem slide."""
+    return (
+        _rect_xml(0, 0, width, I1_05, NAVY),
+        _text_box_xml("CASE VIGNETTE  Q{q_num}  |  {topic}",
+                      I0_3, I0_1, width - I0_6, I0_45,
+                      font_size=14, bold=True, color=GOLD),
+        # Clinical stem text box with light background
+        _rect_xml(I0_3, I1_15, width - I0_6, height - I1_75, NAVY),
+        _text_box_xml("{clinical_stem}",
+                      I0_5, I1_25, width - I1_0, height - I2_0,
+                      font_size=17, color=WHITE, align=PP_ALIGN.LEFT),
+        _text_box_xml(_xml_text("Read the case, then advance to the question."),
+                      I0_4, height - I0_5, width - I0_8, I0_4,
+                      font_size=13, color=NAVY, align=PP_ALIGN.CENTER),
     )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = fill_color
-    if line_color:
-        shape.line.color.rgb = line_color
-    else:
-        shape.line.fill.background()
-    return shape
 
 
 # ---------------------------------------------------------------------------
 # Slide builders
 # ---------------------------------------------------------------------------
 
-def add_title_slide(prs: Presentation, title: str, subtitle: str):
-    slide_layout = prs.slide_layouts[6]  # blank
+def add_title_slide(prs: Presentation, title: str, subtitle: str, slide_layout=None):
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, NAVY)
 
@@ -129,44 +602,44 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str):
     H = prs.slide_height
 
     # Gold accent bar at top
-    _add_rect(slide, 0, 0, W, Inches(0.12), GOLD)
+    _add_rect(slide, 0, 0, W, I0_12, GOLD)
 
     # Main title
     _add_text_box(slide, title,
-                  Inches(0.6), Inches(1.8), W - Inches(1.2), Inches(1.8),
+                  I0_6, I1_8, W - I1_2, I1_8,
                   font_size=40, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
 
     # Subtitle
     _add_text_box(slide, subtitle,
-                  Inches(0.6), Inches(3.8), W - Inches(1.2), Inches(1.2),
+                  I0_6, I3_8, W - I1_2, I1_2,
                   font_size=24, bold=False, color=GOLD, align=PP_ALIGN.CENTER)
 
     # Gold accent bar at bottom
-    _add_rect(slide, 0, H - Inches(0.12), W, Inches(0.12), GOLD)
+    _add_rect(slide, 0, H - I0_12, W, I0_12, GOLD)
 
     return slide
 
 
-def add_section_divider(prs: Presentation, section_name: str):
-    slide_layout = prs.slide_layouts[6]
+def add_section_divider(prs: Presentation, section_name: str, slide_layout=None):
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, NAVY)
 
     W = prs.slide_width
     H = prs.slide_height
 
-    _add_rect(slide, Inches(0.5), H / 2 - Inches(0.06),
-              W - Inches(1.0), Inches(0.06), GOLD)
+    _add_rect(slide, I0_5, H / 2 - I0_06,
+              W - I1_0, I0_06, GOLD)
 
     _add_text_box(slide, section_name,
-                  Inches(0.5), H / 2 - Inches(1.0),
-                  W - Inches(1.0), Inches(0.9),
+                  I0_5, H / 2 - I1_0,
+                  W - I1_0, I0_9,
                   font_size=34, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
 
     return slide
 
 
-def add_instructions_slide(prs: Presentation, format_name: str):
+def add_instructions_slide(prs: Presentation, format_name: str, slide_layout=None):
     """Add a brief instructions slide for the chosen quiz format."""
     instructions = {
         "standard": (
@@ -208,364 +681,257 @@ def add_instructions_slide(prs: Presentation, format_name: str):
     }
     title, bullets = instructions.get(format_name, instructions["standard"])
 
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, LIGHT_GREY)
 
     W = prs.slide_width
     H = prs.slide_height
 
-    _add_rect(slide, 0, 0, W, Inches(1.1), NAVY)
+    _add_rect(slide, 0, 0, W, I1_1, NAVY)
     _add_text_box(slide, title,
-                  Inches(0.4), Inches(0.15), W - Inches(0.8), Inches(0.8),
+                  I0_4, I0_15, W - I0_8, I0_8,
                   font_size=28, bold=True, color=WHITE, align=PP_ALIGN.LEFT)
 
     for i, bullet in enumerate(bullets):
         _add_text_box(slide, f"▸  {bullet}",
-                      Inches(0.7), Inches(1.4) + i * Inches(0.85),
-                      W - Inches(1.2), Inches(0.75),
+                      I0_7, I1_4 + i * I0_85,
+                      W - I1_2, I0_75,
                       font_size=18, color=NAVY, align=PP_ALIGN.LEFT)
 
     return slide
 
 
-def add_notice_slide(prs: Presentation, title: str, message: str):
+def add_notice_slide(prs: Presentation, title: str, message: str, slide_layout=None):
     """Add a simple informational slide for non-fatal generation notices."""
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, LIGHT_GREY)
 
     W = prs.slide_width
     H = prs.slide_height
 
-    _add_rect(slide, 0, 0, W, Inches(1.05), NAVY)
+    _add_rect(slide, 0, 0, W, I1_05, NAVY)
     _add_text_box(slide, title,
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.8),
+                  I0_3, I0_1, W - I0_6, I0_8,
                   font_size=28, bold=True, color=WHITE, align=PP_ALIGN.LEFT)
 
-    _add_rect(slide, Inches(0.35), Inches(1.5), W - Inches(0.7), H - Inches(2.1), WHITE)
+    _add_rect(slide, I0_35, I1_5, W - I0_7, H - I2_1, WHITE)
     _add_text_box(slide, message,
-                  Inches(0.55), Inches(1.75), W - Inches(1.1), H - Inches(2.6),
+                  I0_55, I1_75, W - I1_1, H - I2_6,
                   font_size=20, bold=False, color=NAVY, align=PP_ALIGN.LEFT)
 
     return slide
 
 
-def add_multiple_choice_question(prs: Presentation, q: dict, q_num: int):
-    """
-    Creates TWO slides per question:
-      1. Question + answer choices (participants think / respond)
-      2. Correct-answer reveal + explanation
-    """
-    slide_layout = prs.slide_layouts[6]
-    W = prs.slide_width
-    H = prs.slide_height
-
-    # ---- Slide 1: Question ------------------------------------------------
-    slide = prs.slides.add_slide(slide_layout)
-    _set_slide_background(slide, LIGHT_GREY)
-
-    # Header bar
-    _add_rect(slide, 0, 0, W, Inches(1.05), NAVY)
-    _add_text_box(slide,
-                  f"Q{q_num}  |  {q.get('board_topic', '')}",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.45),
-                  font_size=14, bold=False, color=GOLD, align=PP_ALIGN.LEFT)
-    difficulty_label = q.get("difficulty", "").upper()
-    _add_text_box(slide, f"Difficulty: {difficulty_label}",
-                  W - Inches(2.0), Inches(0.1), Inches(1.8), Inches(0.45),
-                  font_size=13, bold=False, color=LIGHT_GREY, align=PP_ALIGN.RIGHT)
-
-    # Question stem
-    _add_text_box(slide, q["question"],
-                  Inches(0.4), Inches(1.15), W - Inches(0.8), Inches(1.6),
-                  font_size=20, bold=True, color=NAVY, align=PP_ALIGN.LEFT)
-
-    # Answer choices
-    choice_colors = {
-        "A": RGBColor(0x1A, 0x4A, 0x7A),
-        "B": RGBColor(0x1A, 0x4A, 0x7A),
-        "C": RGBColor(0x1A, 0x4A, 0x7A),
-        "D": RGBColor(0x1A, 0x4A, 0x7A),
-    }
-    choices = q.get("choices", {})
-    positions = [
-        (Inches(0.4), Inches(2.9)),
-        (Inches(0.4), Inches(3.75)),
-        (Inches(0.4), Inches(4.6)),
-        (Inches(0.4), Inches(5.45)),
-    ]
-    for idx, (letter, text) in enumerate(choices.items()):
-        if idx >= len(positions):
-            break
-        lx, ly = positions[idx]
-        # coloured pill
-        _add_rect(slide, lx, ly, W - Inches(0.8), Inches(0.75),
-                  choice_colors.get(letter, NAVY))
-        _add_text_box(slide, f"{letter}.  {text}",
-                      lx + Inches(0.15), ly + Inches(0.08),
-                      W - Inches(1.1), Inches(0.6),
-                      font_size=17, bold=False, color=WHITE, align=PP_ALIGN.LEFT)
-
-    # Prompt at bottom
-    _add_text_box(slide, "⏱  Discuss with your team, then advance to reveal the answer.",
-                  Inches(0.4), H - Inches(0.55), W - Inches(0.8), Inches(0.45),
-                  font_size=13, bold=False, color=NAVY, align=PP_ALIGN.CENTER)
-
-    # ---- Slide 2: Answer Reveal -------------------------------------------
-    reveal_slide = prs.slides.add_slide(slide_layout)
-    _set_slide_background(reveal_slide, LIGHT_GREY)
-
-    # Header bar
-    _add_rect(reveal_slide, 0, 0, W, Inches(1.05), GREEN)
-    _add_text_box(reveal_slide,
-                  f"Q{q_num}  ANSWER REVEAL  |  {q.get('board_topic', '')}",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.45),
-                  font_size=14, bold=True, color=WHITE, align=PP_ALIGN.LEFT)
-
-    # Restate question (smaller)
-    _add_text_box(reveal_slide, q["question"],
-                  Inches(0.4), Inches(1.15), W - Inches(0.8), Inches(1.1),
-                  font_size=16, bold=False, color=NAVY, align=PP_ALIGN.LEFT)
-
-    # Re-render choices; highlight correct, grey out others
+def _mc_render_ctx(q: dict, q_num: int) -> tuple:
+    """Escaped template values, choice count and correct-choice index for an MC question."""
+    # At most four choices; extra ones have no pill position.
+    choices = list(q.get("choices", {}).items())[:len(_MC_POSITIONS)]
     correct = q.get("answer", "")
-    for idx, (letter, text) in enumerate(choices.items()):
-        if idx >= len(positions):
-            break
-        lx, ly = positions[idx]
+    values = {
+        "q_num": q_num,
+        "topic": _xml_text(q.get("board_topic", "")),
+        "difficulty": _xml_text(q.get("difficulty", "").upper()),
+        "stem": _xml_text(q["question"]),
+        "explanation": _xml_text(q.get("explanation", "")),
+    }
+    correct_idx = None
+    for idx, (letter, text) in enumerate(choices):
+        values[f"letter{idx}"] = _xml_text(letter)
+        values[f"text{idx}"] = _xml_text(text)
+        values[f"fill{idx}"] = _MC_CHOICE_FILL if letter in _MC_LETTERS else NAVY
         if letter == correct:
-            fill = GREEN
-            icon = "✓"
-            fw = True
-        else:
-            fill = RGBColor(0xCC, 0xCC, 0xCC)
-            icon = " "
-            fw = False
-        _add_rect(reveal_slide, lx, ly, W - Inches(0.8), Inches(0.72), fill)
-        _add_text_box(reveal_slide, f"{icon} {letter}.  {text}",
-                      lx + Inches(0.12), ly + Inches(0.06),
-                      W - Inches(1.1), Inches(0.6),
-                      font_size=17, bold=fw, color=WHITE, align=PP_ALIGN.LEFT)
-
-    # Explanation box
-    _add_rect(reveal_slide, Inches(0.35), H - Inches(1.85),
-              W - Inches(0.7), Inches(1.65), NAVY)
-    _add_text_box(reveal_slide,
-                  f"📚  {q.get('explanation', '')}",
-                  Inches(0.5), H - Inches(1.8),
-                  W - Inches(1.0), Inches(1.55),
-                  font_size=14, bold=False, color=WHITE, align=PP_ALIGN.LEFT)
-
-    return slide, reveal_slide
-
-
-def add_true_false_question(prs: Presentation, q: dict, q_num: int):
-    """Creates TWO slides: question + answer reveal for True/False format."""
-    slide_layout = prs.slide_layouts[6]
-    W = prs.slide_width
-    H = prs.slide_height
+            correct_idx = idx
+    return values, len(choices), correct_idx
 
-    # ---- Slide 1: Question ------------------------------------------------
-    slide = prs.slides.add_slide(slide_layout)
-    _set_slide_background(slide, LIGHT_GREY)
 
-    _add_rect(slide, 0, 0, W, Inches(1.05), NAVY)
-    _add_text_box(slide, f"Q{q_num}  |  True or False?  |  {q.get('board_topic', '')}",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.45),
-                  font_size=14, bold=False, color=GOLD)
-
-    _add_text_box(slide, q["question"],
-                  Inches(0.4), Inches(1.2), W - Inches(0.8), Inches(2.0),
-                  font_size=22, bold=True, color=NAVY, align=PP_ALIGN.LEFT)
-
-    # TRUE / FALSE buttons
-    _add_rect(slide, Inches(0.8), Inches(3.5), Inches(3.6), Inches(1.1), GREEN)
-    _add_text_box(slide, "TRUE", Inches(0.8), Inches(3.6), Inches(3.6), Inches(0.9),
-                  font_size=32, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+def _mc_slides(ctx: tuple, width: int, height: int, first_id: int) -> list:
+    values, n_choices, correct_idx = ctx
+    question = _mc_question_template(width, height, n_choices)
+    reveal = _mc_reveal_template(width, height, n_choices, correct_idx)
+    return [
+        (_LIGHT_GREY_HEX, _fill_shape_template(question, values, first_id)),
+        (_LIGHT_GREY_HEX, _fill_shape_template(reveal, values, first_id)),
+    ]
 
-    _add_rect(slide, Inches(5.5), Inches(3.5), Inches(3.6), Inches(1.1), RED)
-    _add_text_box(slide, "FALSE", Inches(5.5), Inches(3.6), Inches(3.6), Inches(0.9),
-                  font_size=32, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
 
-    _add_text_box(slide, "⏱  Vote now, then advance to the answer.",
-                  Inches(0.4), H - Inches(0.55), W - Inches(0.8), Inches(0.45),
-                  font_size=13, color=NAVY, align=PP_ALIGN.CENTER)
+def _multiple_choice_slides(q: dict, q_num: int, width: int, height: int,
+                            first_id: int) -> list:
+    return _mc_slides(_mc_render_ctx(q, q_num), width, height, first_id)
 
-    # ---- Slide 2: Answer Reveal -------------------------------------------
-    reveal = prs.slides.add_slide(slide_layout)
-    _set_slide_background(reveal, LIGHT_GREY)
 
+def _true_false_slides(q: dict, q_num: int, width: int, height: int,
+                       first_id: int) -> list:
+    values = {
+        "q_num": q_num,
+        "topic": _xml_text(q.get("board_topic", "")),
+        "stem": _xml_text(q["question"]),
+        "explanation": _xml_text(q.get("explanation", "")),
+    }
     answer_is_true = q.get("answer", "").strip().lower() == "true"
-    header_color = GREEN if answer_is_true else RED
-    answer_text = "✓  TRUE" if answer_is_true else "✗  FALSE"
+    question = _true_false_question_template(width, height)
+    reveal = _true_false_reveal_template(width, height, answer_is_true)
+    return [
+        (_LIGHT_GREY_HEX, _fill_shape_template(question, values, first_id)),
+        (_LIGHT_GREY_HEX, _fill_shape_template(reveal, values, first_id)),
+    ]
 
-    _add_rect(reveal, 0, 0, W, Inches(1.05), header_color)
-    _add_text_box(reveal, f"Q{q_num}  ANSWER REVEAL  |  {q.get('board_topic', '')}",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.45),
-                  font_size=14, bold=True, color=WHITE)
 
-    _add_text_box(reveal, q["question"],
-                  Inches(0.4), Inches(1.2), W - Inches(0.8), Inches(1.5),
-                  font_size=18, bold=False, color=NAVY)
+def _case_vignette_slides(q: dict, q_num: int, width: int, height: int,
+                          first_id: int) -> list:
+    # The stem slide fills from the same escaped values as the MC slides.
+    ctx = _mc_render_ctx(q, q_num)
+    values = ctx[0]
+    values["clinical_stem"] = _xml_text(q.get("clinical_stem", ""))
+    stem = _fill_shape_template(_vignette_stem_template(width, height), values, first_id)
+    # Slides 2 & 3 reuse the MC layout (without clinical_stem on the q slide)
+    return [(_LIGHT_GREY_HEX, stem)] + _mc_slides(ctx, width, height, first_id)
 
-    _add_text_box(reveal, answer_text,
-                  Inches(0.4), Inches(2.85), W - Inches(0.8), Inches(0.75),
-                  font_size=36, bold=True, color=header_color, align=PP_ALIGN.CENTER)
 
-    _add_rect(reveal, Inches(0.35), H - Inches(2.1),
-              W - Inches(0.7), Inches(1.9), NAVY)
-    _add_text_box(reveal,
-                  f"📚  {q.get('explanation', '')}",
-                  Inches(0.5), H - Inches(2.05),
-                  W - Inches(1.0), Inches(1.8),
-                  font_size=14, color=WHITE)
+# Rendered slides cross process boundaries, and RGBColor does not unpickle.
+_LIGHT_GREY_HEX = str(LIGHT_GREY)
 
-    return slide, reveal
+_QUESTION_RENDERERS = {
+    "multiple_choice": _multiple_choice_slides,
+    "true_false": _true_false_slides,
+    "case_vignette": _case_vignette_slides,
+}
 
 
-def add_case_vignette_question(prs: Presentation, q: dict, q_num: int):
+def render_question_xml(q: dict, q_num: int, width: int, height: int,
+                        first_shape_id: int = 2) -> list:
     """
-    Case vignette: three slides
-      1. Clinical stem (read / discuss)
-      2. Question + choices
-      3. Answer reveal + explanation
+    Render one question's slides as a list of (background hex colour, shapes XML).
+
+    Depends only on its arguments, so questions can be rendered in worker
+    processes and added to the deck in order afterwards. Unknown question
+    types fall back to multiple choice.
     """
-    slide_layout = prs.slide_layouts[6]
-    W = prs.slide_width
-    H = prs.slide_height
+    renderer = _QUESTION_RENDERERS.get(q.get("type", "multiple_choice"), _multiple_choice_slides)
+    return renderer(q, q_num, width, height, first_shape_id)
 
-    # ---- Slide 1: Clinical Stem -------------------------------------------
-    stem_slide = prs.slides.add_slide(slide_layout)
-    _set_slide_background(stem_slide, LIGHT_GREY)
 
-    _add_rect(stem_slide, 0, 0, W, Inches(1.05), NAVY)
-    _add_text_box(stem_slide,
-                  f"CASE VIGNETTE  Q{q_num}  |  {q.get('board_topic', '')}",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.45),
-                  font_size=14, bold=True, color=GOLD)
+def add_multiple_choice_question(prs: Presentation, q: dict, q_num: int, slide_layout=None):
+    """
+    Creates TWO slides per question:
+      1. Question + answer choices (participants think / respond)
+      2. Correct-answer reveal + explanation
+    """
+    slide_layout = _blank_layout(prs, slide_layout)
+    rendered = _multiple_choice_slides(q, q_num, prs.slide_width, prs.slide_height,
+                                       _first_free_shape_id(slide_layout))
+    return _add_rendered_slides(prs, slide_layout, rendered)
 
-    # Clinical stem text box with light background
-    _add_rect(stem_slide, Inches(0.3), Inches(1.15),
-              W - Inches(0.6), H - Inches(1.75), NAVY)
-    _add_text_box(stem_slide, q.get("clinical_stem", ""),
-                  Inches(0.5), Inches(1.25),
-                  W - Inches(1.0), H - Inches(2.0),
-                  font_size=17, color=WHITE, align=PP_ALIGN.LEFT)
 
-    _add_text_box(stem_slide,
-                  "Read the case, then advance to the question.",
-                  Inches(0.4), H - Inches(0.5),
-                  W - Inches(0.8), Inches(0.4),
-                  font_size=13, color=NAVY, align=PP_ALIGN.CENTER)
+def add_true_false_question(prs: Presentation, q: dict, q_num: int, slide_layout=None):
+    """Creates TWO slides: question + answer reveal for True/False format."""
+    slide_layout = _blank_layout(prs, slide_layout)
+    rendered = _true_false_slides(q, q_num, prs.slide_width, prs.slide_height,
+                                  _first_free_shape_id(slide_layout))
+    return _add_rendered_slides(prs, slide_layout, rendered)
 
-    # ---- Slide 2 & 3: reuse MC logic (without clinical_stem on q slide) ----
-    q_slide, reveal_slide = add_multiple_choice_question(prs, q, q_num)
 
-    return stem_slide, q_slide, reveal_slide
+def add_case_vignette_question(prs: Presentation, q: dict, q_num: int, slide_layout=None):
+    """
+    Case vignette: three slides
+      1. Clinical stem (read / discuss)
+      2. Question + choices
+      3. Answer reveal + explanation
+    """
+    slide_layout = _blank_layout(prs, slide_layout)
+    rendered = _case_vignette_slides(q, q_num, prs.slide_width, prs.slide_height,
+                                     _first_free_shape_id(slide_layout))
+    return _add_rendered_slides(prs, slide_layout, rendered)
 
 
-def add_jeopardy_board(prs: Presentation, categories: list):
+def add_jeopardy_board(prs: Presentation, categories: list, slide_layout=None):
     """
-    Creates a simple Jeopardy game-board slide with category columns
-    and point rows (100, 200, 300, 400, 500).
+    Creates a simple Jeopardy game-board slide: one table with a category
+    header row and point rows (100, 200, 300, 400, 500).
     """
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, NAVY)
 
     W = prs.slide_width
     H = prs.slide_height
 
-    _add_text_box(slide, "EATING DISORDERS  JEOPARDY",
-                  Inches(0.3), Inches(0.05), W - Inches(0.6), Inches(0.65),
-                  font_size=30, bold=True, color=GOLD, align=PP_ALIGN.CENTER)
+    shapes = [
+        _text_box_xml(_template_text("EATING DISORDERS  JEOPARDY"),
+                      I0_3, I0_05, W - I0_6, I0_65,
+                      font_size=30, bold=True, color=GOLD, align=PP_ALIGN.CENTER),
+    ]
 
-    points = [100, 200, 300, 400, 500]
     n_cats = min(len(categories), 5)
 
     if n_cats == 0:
-        _add_text_box(slide,
-                      "No categories available for Jeopardy board.\n"
-                      "Try a different --category filter or remove it.",
-                      Inches(1.0), Inches(2.2), W - Inches(2.0), Inches(2.0),
-                      font_size=24, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+        shapes.append(_text_box_xml(_template_text("No categories available for Jeopardy board.\n"
+                                                   "Try a different --category filter or remove it."),
+                                    I1_0, I2_2, W - I2_0, I2_0,
+                                    font_size=24, bold=True, color=WHITE, align=PP_ALIGN.CENTER))
+        _flush_shapes(slide, shapes)
         return slide
 
-    col_w = (W - Inches(0.4)) / n_cats
-    row_h = (H - Inches(0.85)) / (len(points) + 1)
-
-    # Category headers
-    for ci, cat in enumerate(categories[:n_cats]):
-        lx = Inches(0.2) + ci * col_w
-        _add_rect(slide, lx + Inches(0.05), Inches(0.75),
-                  col_w - Inches(0.1), row_h - Inches(0.08), GOLD)
-        _add_text_box(slide, cat,
-                      lx + Inches(0.08), Inches(0.78),
-                      col_w - Inches(0.16), row_h - Inches(0.14),
-                      font_size=13, bold=True, color=NAVY, align=PP_ALIGN.CENTER)
-
-    # Point cells
-    for ri, pts in enumerate(points):
-        row_top = Inches(0.75) + (ri + 1) * row_h
-        for ci in range(n_cats):
-            lx = Inches(0.2) + ci * col_w
-            _add_rect(slide, lx + Inches(0.05), row_top + Inches(0.04),
-                      col_w - Inches(0.1), row_h - Inches(0.12), GOLD)
-            _add_text_box(slide, f"${pts}",
-                          lx + Inches(0.08), row_top + Inches(0.07),
-                          col_w - Inches(0.16), row_h - Inches(0.18),
-                          font_size=22, bold=True, color=NAVY, align=PP_ALIGN.CENTER)
+    # Navy borders 0.1" wide stand in for the gaps between cells, so the table
+    # starts half a border above the first row of gold.
+    col_w = (W - I0_4) / n_cats
+    row_h = (H - I0_85) / (len(_JEOPARDY_POINT_LABELS) + 1)
+    rows = [[(_template_text(cat), 13) for cat in categories[:n_cats]]]
+    rows += [[(label, 22)] * n_cats for label in _JEOPARDY_POINT_LABELS]
+    shapes.append(_table_xml(rows, I0_2, I0_75 - I0_05, col_w, row_h, GOLD,
+                             NAVY, I0_1, color=NAVY))
 
+    _flush_shapes(slide, shapes)
     return slide
 
 
-def add_score_tracker(prs: Presentation, n_teams: int = 4):
+def add_score_tracker(prs: Presentation, n_teams: int = 4, slide_layout=None):
     """Adds a simple score-tracker slide."""
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, NAVY)
 
     W = prs.slide_width
     H = prs.slide_height
 
-    _add_text_box(slide, "SCORE TRACKER",
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.7),
-                  font_size=34, bold=True, color=GOLD, align=PP_ALIGN.CENTER)
-
-    team_names = [f"Team {i + 1}" for i in range(n_teams)]
-    col_w = (W - Inches(0.6)) / n_teams
-
-    for ti, name in enumerate(team_names):
-        lx = Inches(0.3) + ti * col_w
-        _add_rect(slide, lx + Inches(0.1), Inches(0.95),
-                  col_w - Inches(0.2), Inches(0.65), GOLD)
-        _add_text_box(slide, name,
-                      lx + Inches(0.12), Inches(1.0),
-                      col_w - Inches(0.24), Inches(0.55),
-                      font_size=20, bold=True, color=NAVY, align=PP_ALIGN.CENTER)
+    shapes = [
+        _text_box_xml("SCORE TRACKER",
+                      I0_3, I0_1, W - I0_6, I0_7,
+                      font_size=34, bold=True, color=GOLD, align=PP_ALIGN.CENTER),
+    ]
+
+    col_w = (W - I0_6) / n_teams
+    cell_w = col_w - I0_2
+    text_w = col_w - I0_24
+    score_h = H - I2_2
+
+    for ti in range(n_teams):
+        x = I0_3 + ti * col_w + I0_1
+        shapes.append(_filled_text_xml(f"Team {ti + 1}",
+                                       x, I0_95, cell_w, I0_65, GOLD,
+                                       (I0_02, I0_05), text_w,
+                                       font_size=20, bold=True, color=NAVY, align=PP_ALIGN.CENTER))
         # Score area
-        _add_rect(slide, lx + Inches(0.1), Inches(1.65),
-                  col_w - Inches(0.2), H - Inches(2.2),
-                  RGBColor(0x1A, 0x3A, 0x6A))
-        _add_text_box(slide, "0",
-                      lx + Inches(0.12), Inches(1.9),
-                      col_w - Inches(0.24), Inches(1.2),
-                      font_size=48, bold=True, color=GOLD, align=PP_ALIGN.CENTER)
+        shapes.append(_filled_text_xml("0",
+                                       x, I1_65, cell_w, score_h, _SCORE_AREA_FILL,
+                                       (I0_02, I0_25), text_w,
+                                       font_size=48, bold=True, color=GOLD, align=PP_ALIGN.CENTER))
 
+    _flush_shapes(slide, shapes)
     return slide
 
 
-def add_lightning_round_slide(prs: Presentation):
+def add_lightning_round_slide(prs: Presentation, slide_layout=None):
     """Adds a slide with rapid-fire team challenge rules."""
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, NAVY)
 
     W = prs.slide_width
 
     _add_text_box(slide, "LIGHTNING ROUND",
-                  Inches(0.3), Inches(0.12), W - Inches(0.6), Inches(0.8),
+                  I0_3, I0_12, W - I0_6, I0_8,
                   font_size=36, bold=True, color=GOLD, align=PP_ALIGN.CENTER)
 
     rules = [
@@ -576,37 +942,40 @@ def add_lightning_round_slide(prs: Presentation):
     ]
     for idx, rule in enumerate(rules):
         _add_text_box(slide, rule,
-                      Inches(1.0), Inches(1.6) + idx * Inches(0.9),
-                      W - Inches(2.0), Inches(0.65),
+                      I1_0, I1_6 + idx * I0_9,
+                      W - I2_0, I0_65,
                       font_size=24, bold=True, color=WHITE, align=PP_ALIGN.LEFT)
 
     _add_text_box(slide, "Tip: Keep pace brisk and debrief after every 3-5 questions.",
-                  Inches(0.8), Inches(5.9), W - Inches(1.6), Inches(0.6),
+                  I0_8, I5_9, W - I1_6, I0_6,
                   font_size=16, bold=False, color=LIGHT_GREY, align=PP_ALIGN.CENTER)
 
     return slide
 
 
-def add_key_facts_slide(prs: Presentation, facts: list, title: str = "High-Yield Board Facts"):
+def add_key_facts_slide(prs: Presentation, facts: list, title: str = "High-Yield Board Facts",
+                        slide_layout=None):
     """Summary slide with bullet-point key facts."""
-    slide_layout = prs.slide_layouts[6]
+    slide_layout = _blank_layout(prs, slide_layout)
     slide = prs.slides.add_slide(slide_layout)
     _set_slide_background(slide, LIGHT_GREY)
 
     W = prs.slide_width
-    H = prs.slide_height
 
-    _add_rect(slide, 0, 0, W, Inches(1.05), NAVY)
-    _add_text_box(slide, title,
-                  Inches(0.3), Inches(0.1), W - Inches(0.6), Inches(0.8),
-                  font_size=28, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    shapes = [
+        _rect_xml(0, 0, W, I1_05, NAVY),
+        _text_box_xml(_template_text(title),
+                      I0_3, I0_1, W - I0_6, I0_8,
+                      font_size=28, bold=True, color=WHITE, align=PP_ALIGN.CENTER),
+    ]
 
-    for i, fact in enumerate(facts[:7]):
-        _add_text_box(slide, f"★  {fact}",
-                      Inches(0.5), Inches(1.2) + i * Inches(0.72),
-                      W - Inches(1.0), Inches(0.65),
-                      font_size=16, color=NAVY, align=PP_ALIGN.LEFT)
+    fact_w = W - I1_0
+    for top, fact in zip(_FACT_TOPS, facts):
+        shapes.append(_text_box_xml(_template_text(f"★  {fact}"),
+                                    I0_5, top, fact_w, I0_65,
+                                    font_size=16, color=NAVY, align=PP_ALIGN.LEFT))
 
+    _flush_shapes(slide, shapes)
     return slide
 
 
@@ -617,7 +986,7 @@ def add_key_facts_slide(prs: Presentation, facts: list, title: str = "High-Yield
 def build_presentation(quiz_bank: dict, category_filter: str = None,
                         fmt: str = "standard", output_path: str = None,
                         template_path: str = None,
-                        insert_position: str = "end") -> str:
+                        insert_position: str = "end", jobs: int = 1) -> tuple[str, int]:
     """
     Build the full quiz PowerPoint presentation.
 
@@ -629,15 +998,21 @@ def build_presentation(quiz_bank: dict, category_filter: str = None,
     output_path     : output .pptx file path (default: eating_disorders_quiz.pptx)
     template_path   : optional existing .pptx to append quiz slides to
     insert_position : 'end' (default) or 'start' when using template
+    jobs            : worker processes used to render question slides (default 1)
+
+    Returns (output_path, slide_count), where slide_count includes any
+    template slides.
     """
     if template_path:
         prs = Presentation(template_path)
     else:
         prs = Presentation()
-        prs.slide_width = Inches(13.33)
-        prs.slide_height = Inches(7.5)
+        prs.slide_width = I13_33
+        prs.slide_height = I7_5
 
     original_slide_count = len(prs.slides)
+    # One blank layout shared by every builder, instead of a lookup per slide.
+    slide_layout = prs.slide_layouts[6]
 
     metadata = quiz_bank.get("metadata", {})
     output_path = output_path or "eating_disorders_quiz.pptx"
@@ -647,21 +1022,22 @@ def build_presentation(quiz_bank: dict, category_filter: str = None,
         prs,
         metadata.get("title", "Eating Disorders Quiz"),
         f"Psychiatry Residency Board Review\n{metadata.get('last_updated', '')}",
+        slide_layout,
     )
 
     # ---- Instructions slide ------------------------------------------------
-    add_instructions_slide(prs, fmt)
+    add_instructions_slide(prs, fmt, slide_layout)
 
     # ---- Jeopardy game board (jeopardy format only) -----------------------
     categories = _get_filtered_categories(quiz_bank, category_filter)
 
     if fmt == "jeopardy":
         cat_names = [c["name"] for c in categories][:5]
-        add_jeopardy_board(prs, cat_names)
-        add_score_tracker(prs)
+        add_jeopardy_board(prs, cat_names, slide_layout=slide_layout)
+        add_score_tracker(prs, slide_layout=slide_layout)
     elif fmt == "lightning_round":
-        add_lightning_round_slide(prs)
-        add_score_tracker(prs)
+        add_lightning_round_slide(prs, slide_layout)
+        add_score_tracker(prs, slide_layout=slide_layout)
 
     if category_filter and not categories:
         add_notice_slide(
@@ -670,26 +1046,36 @@ def build_presentation(quiz_bank: dict, category_filter: str = None,
             f"No categories matched filter: '{category_filter}'.\n\n"
             "A deck was still generated with intro and high-yield summary slides.\n"
             "Use --category with a broader value or run without filtering.",
+            slide_layout,
         )
 
     # ---- Question slides ---------------------------------------------------
-    q_num = 0
+    # Questions are rendered to XML first (optionally across processes), then
+    # added in order behind their section dividers.
+    questions = [q for category in categories for q in category.get("questions", [])]
+    render_args = (
+        questions,
+        range(1, len(questions) + 1),
+        repeat(int(prs.slide_width)),
+        repeat(int(prs.slide_height)),
+        repeat(_first_free_shape_id(slide_layout)),
+    )
+    if jobs > 1 and len(questions) > 1:
+        # Imported here so single-process builds skip loading multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor
 
-    for category in categories:
-        add_section_divider(prs, category["name"])
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(questions) // (jobs * 4))
+            rendered = list(pool.map(render_question_xml, *render_args, chunksize=chunksize))
+    else:
+        rendered = map(render_question_xml, *render_args)
 
-        for q in category.get("questions", []):
-            q_num += 1
-            q_type = q.get("type", "multiple_choice")
+    rendered = iter(rendered)
+    for category in categories:
+        add_section_divider(prs, category["name"], slide_layout)
 
-            if q_type == "multiple_choice":
-                add_multiple_choice_question(prs, q, q_num)
-            elif q_type == "true_false":
-                add_true_false_question(prs, q, q_num)
-            elif q_type == "case_vignette":
-                add_case_vignette_question(prs, q, q_num)
-            else:
-                add_multiple_choice_question(prs, q, q_num)
+        for _ in category.get("questions", []):
+            _add_rendered_slides(prs, slide_layout, next(rendered))
 
     # ---- High-yield facts summary -----------------------------------------
     high_yield_facts = [
@@ -704,8 +1090,10 @@ def build_presentation(quiz_bank: dict, category_filter: str = None,
         "FBT (Maudsley) = first-line therapy for adolescents with AN.",
         "CBT-E = first-line psychotherapy for BN and BED in adults.",
     ]
-    add_key_facts_slide(prs, high_yield_facts[:7], "High-Yield Board Facts – Part 1")
-    add_key_facts_slide(prs, high_yield_facts[7:], "High-Yield Board Facts – Part 2")
+    add_key_facts_slide(prs, high_yield_facts[:7], "High-Yield Board Facts – Part 1",
+                        slide_layout)
+    add_key_facts_slide(prs, high_yield_facts[7:], "High-Yield Board Facts – Part 2",
+                        slide_layout)
 
     if template_path:
         _place_new_slides(prs, original_slide_count, insert_position)
@@ -714,8 +1102,8 @@ def build_presentation(quiz_bank: dict, category_filter: str = None,
     if output.parent != Path("."):
         output.parent.mkdir(parents=True, exist_ok=True)
 
-    prs.save(str(output))
-    return str(output)
+    _save_presentation(prs, str(output))
+    return str(output), len(prs.slides)
 
 
 # ---------------------------------------------------------------------------
@@ -770,6 +1158,12 @@ def main():
             "If omitted, a new presentation is created."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to render question slides (default: 1).",
+    )
     parser.add_argument(
         "--insert-position",
         type=str,
@@ -811,17 +1205,17 @@ def main():
             "Using existing template: "
             f"{template_path}  [insert_position={args.insert_position}]"
         )
-    output = build_presentation(
+    output, n_slides = build_presentation(
         quiz_bank,
         category_filter=args.category,
         fmt=args.fmt,
         output_path=args.output,
         template_path=template_path,
         insert_position=args.insert_position,
+        jobs=args.jobs,
     )
 
     print(f"✅  Saved: {output}")
-    n_slides = len(__import__("pptx").Presentation(output).slides)
     print(f"   Total slides: {n_slides}")
 
 